@@ -6,17 +6,16 @@ import calendar
 import openpyxl
 import os
 
-# Function to load data from an Excel file
-def load_data(file_path, sheet_name):
-    try:
-        return pd.read_excel(file_path, sheet_name=sheet_name, engine="openpyxl")
-    except ValueError:  # Handle case where the sheet does not exist
-        st.warning(f"Sheet '{sheet_name}' not found in {file_path}. Proceeding without it.")
-        return pd.DataFrame()  # Return an empty DataFrame
+from task_data import load_data, list_months, month_file_path, prefetch_months
+from shared_dataset import load_tasks
+import velocity
+import search_index
+import carry_over
+from resource_charts import resource_charts, uncompleted_tasks_by_month
 
 # Sidebar navigation
 st.sidebar.title("Navigation")
-app_mode = st.sidebar.radio("Choose an option", ["Month-wise Summary","Resource-wise Analytics", "Compare All Months"])
+app_mode = st.sidebar.radio("Choose an option", ["Month-wise Summary","Resource-wise Analytics", "Velocity", "Search Tasks", "Carry-over", "Compare All Months"])
 
 if app_mode == "Month-wise Summary":
     selected_month = st.selectbox(
@@ -26,7 +25,7 @@ if app_mode == "Month-wise Summary":
     )
 
     # Define file path based on selected month
-    file_path = f'{selected_month}.xlsx'
+    file_path = month_file_path(selected_month)
 
     sheet_name_loop = 'Loop Tasks'
     sheet_name_sprint = 'Sprint Tasks'
@@ -138,83 +137,20 @@ if app_mode == "Month-wise Summary":
         else:
             st.write(f"No completed tasks for {assignee}.")
 
+    # Page is rendered; parse the neighbouring and remaining months in the
+    # background so switching the month selectbox is usually a cache hit
+    prefetch_months(selected_month)
+
 # Resource-wise Analytics Section
 elif app_mode == "Resource-wise Analytics":
     # Load data from all available months first
-    current_directory = os.path.dirname(os.path.abspath(__file__))
-    files = [f for f in os.listdir(current_directory) if f.endswith(".xlsx")]
-    months_available = [os.path.splitext(f)[0] for f in files]
-
-    # Initialize empty DataFrames to store combined data
-    all_sprint_data = pd.DataFrame()
-    all_loop_data = pd.DataFrame()
-
-    # Load and combine data from all months
-    for month in months_available:
-        file_path = f'{month}.xlsx'
-        
-        # Load data from both sheets
-        df_sprint = load_data(file_path, 'Sprint Tasks')
-        df_loop = load_data(file_path, 'Loop Tasks')
-        
-        if not df_sprint.empty:
-            df_sprint['Month'] = month
-            df_sprint.columns = df_sprint.columns.str.strip()
-            df_sprint['Assignee'] = df_sprint['Assignee'].apply(lambda x: x.split()[0] if isinstance(x, str) else None)
-            df_sprint = df_sprint.rename(columns={'Assignee': 'Resource Name', 'Created': 'Date', "Summary": "Tasks List"})
-            df_sprint['Tasks Type'] = "Sprint"
-            all_sprint_data = pd.concat([all_sprint_data, df_sprint], ignore_index=True)
-            
-        if not df_loop.empty:
-            df_loop['Month'] = month
-            df_loop.columns = df_loop.columns.str.strip()
-            df_loop['Tasks Type'] = "Loop"
-            all_loop_data = pd.concat([all_loop_data, df_loop], ignore_index=True)
+    months_available = list_months()
 
-    # Combine all data
-    df = pd.concat([all_loop_data, all_sprint_data], ignore_index=True)
+    # Combine Sprint and Loop data from all months
+    # (attached from the shared memory-mapped table when TASK_DATA_MODE=shared)
+    df = load_tasks()
 
     if not df.empty:
-        df['Resource Name'] = df['Resource Name'].str.strip()
-        replace_dict = {
-            'V': 'Thota', 
-            'SaradhiMuneendra': 'Saradhi',
-            'SaradhiMuneendra Gundabattina': 'Saradhi',
-            'Saradhi Muneendra Gundabattina': 'Saradhi',
-            "Palaniyappan": "Palan",
-            "Achyut Deshpande": "Achyut",
-            "Ajay kumar": "Ajay Kumar",
-            "Ajay": "Ajay Kumar",
-            'Sai': 'Sai Sampath Chinthavatla',
-            'Amitabh': 'Amitabh Sharma',
-            "Sneha": "Sneha Guthe",
-            'MS Manoj Singh': 'Manoj Singh',
-            "Somesh": "Somesh Fengade",
-            "Gopal": 'Gopalswamy Ramalingam',
-            'Naveen Adusumilli': 'Naveen',
-            "Manoj Singh Rawat": "Manoj Singh",
-            "Manoj": "Manoj Singh",
-            "Varad": "Varad Bhalsing",
-            "Varad Balasaheb Bhalsing": "Varad Bhalsing",
-            "Mahesh Katti": "Mahesh"
-        }
-        df['Resource Name'] = df['Resource Name'].replace(replace_dict)
-
-        # Convert Date column to datetime
-
-        if not df.empty:
-            # Clean and convert Date column with error handling
-            def safe_date_conversion(date_series):
-                try:
-                    return pd.to_datetime(date_series, errors='coerce')
-                except Exception as e:
-                    st.warning(f"Some dates could not be parsed. They will be treated as missing values.")
-                    return pd.to_datetime(date_series, errors='coerce')
-
-            df['Date'] = safe_date_conversion(df['Date'])
-            # Remove rows where Date is NaT (Not a Time)
-            df = df.dropna(subset=['Date'])
-
         # First select person
         selected_person = st.selectbox(
             'Select a person:',
@@ -236,93 +172,173 @@ elif app_mode == "Resource-wise Analytics":
         if selected_months:
             filtered_df = filtered_df[filtered_df['Month'].isin(selected_months)]
 
-        # Task Status Distribution by Month
-        fig_status_by_month = px.bar(
-            filtered_df.groupby(['Month', 'Status']).size().unstack(fill_value=0),
-            barmode='stack',
-            title=f"Task Status Distribution by Month for {selected_person}"
+        charts = resource_charts(filtered_df, selected_person)
+        st.plotly_chart(charts['status_by_month'])
+        st.plotly_chart(charts['task_type'])
+        st.plotly_chart(charts['tasks_over_time'])
+        st.plotly_chart(charts['heatmap'])
+
+        st.write("### Uncompleted Tasks by Month", uncompleted_tasks_by_month(filtered_df))
+
+        st.plotly_chart(charts['timeline'])
+
+
+# Velocity Section
+elif app_mode == "Velocity":
+    st.header("Velocity and Throughput")
+
+    # Metrics are materialized per month next to the workbooks; only added
+    # or changed months are parsed, the charts read the stored series.
+    metrics = velocity.refresh_metrics()
+
+    if metrics['monthly'].empty:
+        st.warning("No task data available to compute velocity metrics.")
+    else:
+        selected_person = st.selectbox(
+            'Select a person:',
+            options=['All'] + sorted(metrics['monthly']['Resource Name'].unique()),
+            index=0
         )
-        st.plotly_chart(fig_status_by_month)
+        selected_types = st.multiselect(
+            "Select Task Types:",
+            options=sorted(metrics['monthly']['Tasks Type'].unique()),
+            default=sorted(metrics['monthly']['Tasks Type'].unique())
+        )
+
+        weekly_series, monthly_series = velocity.select_series(metrics, selected_person, selected_types)
 
-        # Task Type distribution by Month
-        fig_task_type = px.histogram(
-            filtered_df, 
-            x='Month', 
+        # Summary Metrics Section
+        total_tasks = int(monthly_series['Total'].sum())
+        completed_count = int(monthly_series['Done'].sum())
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Completion Rate", f"{completed_count / total_tasks:.0%}" if total_tasks else "-")
+        col2.metric("Avg Weekly Throughput", f"{weekly_series['Done'].mean():.1f}" if not weekly_series.empty else "-")
+        col3.metric("Not Done Tasks", int(monthly_series['Not Done'].sum()))
+
+        # Weekly Throughput
+        fig_weekly = px.line(
+            weekly_series.melt(id_vars='Week', value_vars=['Done', 'Rolling Done'],
+                               var_name='Series', value_name='Tasks'),
+            x='Week',
+            y='Tasks',
+            color='Series',
+            title=f'Weekly Throughput ({velocity.rolling_weeks}-week rolling) for {selected_person}'
+        )
+        st.plotly_chart(fig_weekly)
+
+        # Monthly Throughput
+        fig_monthly = px.bar(
+            monthly_series,
+            x='Month',
+            y='Done',
             color='Tasks Type',
-            title=f'Task Type Distribution by Month for {selected_person}'
+            barmode='group',
+            title=f'Monthly Throughput for {selected_person}',
+            labels={'Done': 'Completed Tasks'}
         )
-        st.plotly_chart(fig_task_type)
-
-            # In the Resource-wise Analytics section, update the Task Load Over Time visualization:
-
-            # Task Load Over Time
-        filtered_df['Date'] = pd.to_datetime(filtered_df['Date'])  # Ensure Date is datetime
-        tasks_over_time = filtered_df.groupby([
-            filtered_df['Date'].dt.strftime('%Y-%m-%d'),  # Convert to string format
-            'Month'
-        ]).size().reset_index(name='Task Count')
-        tasks_over_time['Date'] = pd.to_datetime(tasks_over_time['Date'])  # Convert back to datetime
-
-        fig_tasks_over_time = px.line(
-            tasks_over_time,
-            x='Date', 
-            y='Task Count',
-            color='Month',
-            title=f'Task Load Over Time for {selected_person}'
+        st.plotly_chart(fig_monthly)
+
+        # Done Ratio by Month
+        fig_done_ratio = px.line(
+            monthly_series,
+            x='Month',
+            y='Done Ratio',
+            color='Tasks Type',
+            markers=True,
+            title=f'Done Ratio by Month for {selected_person}'
         )
-        st.plotly_chart(fig_tasks_over_time)
-
-        # Monthly Task Completion Heatmap - Update this section as well
-        completion_counts = filtered_df[filtered_df['Status'] == 'Done'].groupby([
-            'Month',
-            filtered_df['Date'].dt.strftime('%Y-%m-%d')  # Convert to string format
-        ]).size().reset_index(name='Completions')
-        completion_counts['Date'] = pd.to_datetime(completion_counts['Date'])
-        completion_counts['Day'] = completion_counts['Date'].dt.day
-
-        fig_heatmap = px.density_heatmap(
-            completion_counts,
+        fig_done_ratio.update_yaxes(tickformat='.0%')
+        st.plotly_chart(fig_done_ratio)
+
+        # Not Done by Month
+        fig_carry_over = px.bar(
+            monthly_series,
             x='Month',
-            y='Day',
-            z='Completions',
-            title=f"Task Completion Heatmap for {selected_person}"
+            y='Not Done',
+            color='Tasks Type',
+            barmode='stack',
+            title=f'Not Done Tasks by Month for {selected_person}'
         )
-        st.plotly_chart(fig_heatmap)
-
-        # Uncompleted Tasks by Month
-        uncompleted_tasks = filtered_df[filtered_df['Status'] != 'Done']
-        grouped_incomplete_tasks = uncompleted_tasks.groupby(['Month', 'Resource Name'])['Tasks List'].apply(lambda x: ', '.join(x)).reset_index()
-        grouped_incomplete_tasks['Unique Incomplete Tasks'] = grouped_incomplete_tasks['Tasks List'].apply(lambda x: set(task.strip() for task in x.split(',')))
-        grouped_incomplete_tasks.drop(columns=['Tasks List'], inplace=True)
-        st.write("### Uncompleted Tasks by Month", grouped_incomplete_tasks)
-
-        # Task Timeline
-        fig_timeline = px.scatter(
-            filtered_df, 
-            x='Date', 
-            y='Month',
-            color='Status',
-            hover_data=['Tasks List', 'Status'],
-            title=f'Task Timeline for {selected_person}'
+        st.plotly_chart(fig_carry_over)
+
+        st.write("### Monthly Velocity Table", monthly_series)
+
+# Search Tasks Section
+elif app_mode == "Search Tasks":
+    st.header("Search Tasks")
+
+    # Queries run against the inverted index of task titles; only months
+    # added or changed since the last visit are re-indexed. Matching rows
+    # are read from the task table (shared when TASK_DATA_MODE=shared).
+    index = search_index.refresh_index()
+    tasks = load_tasks()
+
+    query = st.text_input("Search task titles:")
+    col1, col2, col3 = st.columns(3)
+    selected_people = col1.multiselect("Resource Name", options=search_index.filter_options(tasks, 'Resource Name'))
+    selected_statuses = col2.multiselect("Status", options=search_index.filter_options(tasks, 'Status'))
+    selected_months = col3.multiselect("Month", options=list(index['months']))
+
+    if query:
+        matches = search_index.search(index, tasks, query, selected_people, selected_statuses, selected_months)
+        if matches.empty:
+            st.write(f"No tasks found for '{query}'.")
+        else:
+            page_size = 25
+            page_count = (len(matches) - 1) // page_size + 1
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+            start = (page - 1) * page_size
+            st.write(f"Showing {start + 1}-{min(start + page_size, len(matches))} of {len(matches)} tasks")
+            st.dataframe(search_index.result_page(matches, page, page_size), hide_index=True)
+
+# Carry-over Section
+elif app_mode == "Carry-over":
+    st.header("Cross-Month Carry-over")
+
+    # Tasks left pending at the end of a month, followed into the next month
+    carried = carry_over.carry_over(load_tasks())
+
+    if carried.empty:
+        st.warning("Carry-over needs task data from at least two months.")
+    else:
+        selected_person = st.selectbox(
+            'Select a person:',
+            options=['All'] + sorted(carried['Resource Name'].dropna().unique()),
+            index=0
         )
-        st.plotly_chart(fig_timeline)
-
+        if selected_person != 'All':
+            carried = carried[carried['Resource Name'] == selected_person]
 
-else:
-    # Get the directory where the code file resides
-    current_directory = os.path.dirname(os.path.abspath(__file__))
+        # Summary Metrics Section
+        outcome_counts = carried['Outcome'].value_counts()
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Still Pending", int(outcome_counts.get(carry_over.outcome_still_pending, 0)))
+        col2.metric("Completed Late", int(outcome_counts.get(carry_over.outcome_completed_late, 0)))
+        col3.metric("Vanished", int(outcome_counts.get(carry_over.outcome_vanished, 0)))
+
+        if not carried.empty:
+            # Carry-over Outcomes by Month
+            summary = carry_over.carry_over_summary(carried)
+            fig_carry_over = px.bar(
+                summary,
+                x='Transition',
+                y=carry_over.outcomes,
+                barmode='stack',
+                title=f'Outcome of Pending Tasks in the Following Month for {selected_person}',
+                labels={'value': 'Tasks', 'variable': 'Outcome'}
+            )
+            st.plotly_chart(fig_carry_over)
 
-    # Function to load data from an Excel file
-    def load_data(file_path, sheet_name):
-        try:
-            return pd.read_excel(file_path, sheet_name=sheet_name, engine="openpyxl")
-        except ValueError:  # Handle case where the sheet does not exist
-            st.warning(f"Sheet '{sheet_name}' not found in {file_path}. Proceeding without it.")
-            return pd.DataFrame()  # Return an empty DataFrame
+            # Carried-over Task Details
+            selected_outcomes = st.multiselect(
+                "Show Outcomes:",
+                options=carry_over.outcomes,
+                default=[carry_over.outcome_still_pending, carry_over.outcome_completed_late]
+            )
+            st.dataframe(carried[carried['Outcome'].isin(selected_outcomes)], hide_index=True)
 
-    # List all Excel files in the current directory
-    files = [f for f in os.listdir(current_directory) if f.endswith(".xlsx")]
-    months_available = [os.path.splitext(f)[0] for f in files]  # Extract month names
+else:
+    months_available = list_months()
 
     # Streamlit section for month-wise comparison
     st.header("Month-Wise Progress Comparison")
@@ -336,48 +352,17 @@ else:
         )
 
         if selected_months:
-            # Load data for selected months
-            monthly_data = {}
-            for month in selected_months:
-                file_path = os.path.join(current_directory, f"{month}.xlsx")
-                sprint_data = load_data(file_path, "Sprint Tasks")
-                loop_data = load_data(file_path, "Loop Tasks")
-
-                # Preprocess and combine the data
-                if not sprint_data.empty:
-                    sprint_data["Tasks Type"] = "Sprint"
-                if not loop_data.empty:
-                    loop_data["Tasks Type"] = "Loop"
-
-                combined_data = pd.concat([sprint_data, loop_data], ignore_index=True)
-                combined_data["Month"] = month
-                monthly_data[month] = combined_data
-
-            # Combine data from all selected months
-            all_months_data = pd.concat(monthly_data.values(), ignore_index=True)
-
-            # Clean column names
-            all_months_data.columns = all_months_data.columns.str.strip()
-
-            # Ensure 'Date' column is properly converted to datetime
-            if "Date" in all_months_data.columns:
-                all_months_data["Date"] = pd.to_datetime(all_months_data["Date"], errors="coerce")
-
-                # Drop rows with NaT in the Date column
-                all_months_data = all_months_data.dropna(subset=["Date"])
-
-                # Create a new column for the period
-                all_months_data["Month_Period"] = all_months_data["Date"].dt.to_period("M")
-            else:
-                st.warning("'Date' column not found in the data.")
-                all_months_data["Month_Period"] = "Unknown"
+            # Rows of the selected months as they are in the workbooks
+            # (attached from the shared memory-mapped table when TASK_DATA_MODE=shared)
+            all_months_data = load_tasks(include_undated=True)
+            all_months_data = all_months_data[all_months_data["Month"].isin(selected_months)]
 
-            # Drop rows where 'Status' is missing or not a string
-            if "Status" in all_months_data.columns:
-                all_months_data = all_months_data.dropna(subset=["Status"])
-            else:
-                st.warning("'Status' column not found in the data.")
-                all_months_data["Status"] = "Unknown"
+            # Periods come from the sheets' own Date column; rows without one are dropped
+            all_months_data = all_months_data.dropna(subset=["Source Date"])
+            all_months_data = all_months_data.assign(Month_Period=all_months_data["Source Date"].dt.to_period("M"))
+
+            # Drop rows where 'Status' is missing
+            all_months_data = all_months_data.dropna(subset=["Status"])
 
             
 
@@ -426,7 +411,7 @@ else:
                 st.error(f"Error in Task Completion Trend Analysis: {e}")
             # Assignee Performance Across Months
             st.subheader("Assignee Performance Comparison Across Months")
-            if "Assignee" in all_months_data.columns:
+            if all_months_data["Assignee"].notna().any():
                 assignee_performance = all_months_data.groupby(["Month", "Assignee"]).size().unstack(fill_value=0)
                 fig_assignee_perf = px.bar(
                     assignee_performance,
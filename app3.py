@@ -13,20 +13,10 @@ import calendar
 import openpyxl
 import os
 
-# Get the directory where the code file resides
-current_directory = os.path.dirname(os.path.abspath(__file__))
+from task_data import list_months
+from shared_dataset import load_tasks
 
-# Function to load data from an Excel file
-def load_data(file_path, sheet_name):
-    try:
-        return pd.read_excel(file_path, sheet_name=sheet_name, engine="openpyxl")
-    except ValueError:  # Handle case where the sheet does not exist
-        st.warning(f"Sheet '{sheet_name}' not found in {file_path}. Proceeding without it.")
-        return pd.DataFrame()  # Return an empty DataFrame
-
-# List all Excel files in the current directory
-files = [f for f in os.listdir(current_directory) if f.endswith(".xlsx")]
-months_available = [os.path.splitext(f)[0] for f in files]  # Extract month names
+months_available = list_months()
 
 # Streamlit section for month-wise comparison
 st.header("Month-Wise Progress Comparison")
@@ -40,35 +30,13 @@ if months_available:
     )
 
     if selected_months:
-        # Load data for selected months
-        monthly_data = {}
-        for month in selected_months:
-            file_path = os.path.join(current_directory, f"{month}.xlsx")
-            sprint_data = load_data(file_path, "Sprint Tasks")
-            loop_data = load_data(file_path, "Loop Tasks")
-
-            # Preprocess and combine the data
-            if not sprint_data.empty:
-                sprint_data["Tasks Type"] = "Sprint"
-            if not loop_data.empty:
-                loop_data["Tasks Type"] = "Loop"
-
-            combined_data = pd.concat([sprint_data, loop_data], ignore_index=True)
-            combined_data["Month"] = month
-            monthly_data[month] = combined_data
-
-        # Combine data from all selected months
-        all_months_data = pd.concat(monthly_data.values(), ignore_index=True)
-
-        # Clean column names
-        all_months_data.columns = all_months_data.columns.str.strip()
+        # Rows of the selected months as they are in the workbooks
+        # (attached from the shared memory-mapped table when TASK_DATA_MODE=shared)
+        all_months_data = load_tasks(include_undated=True)
+        all_months_data = all_months_data[all_months_data["Month"].isin(selected_months)]
 
         # Drop rows where 'Status' is missing
-        if "Status" in all_months_data.columns:
-            all_months_data = all_months_data.dropna(subset=["Status"])
-        else:
-            st.warning("The 'Status' column is missing from the data.")
-            all_months_data["Status"] = "Unknown"
+        all_months_data = all_months_data.dropna(subset=["Status"])
 
         # Task Status Distribution
         st.subheader("Task Status Distribution Across Months")
@@ -97,9 +65,9 @@ if months_available:
 
         # Task Completion Trend
         st.subheader("Task Completion Trend Across Months")
-        if "Date" in all_months_data.columns:
-            all_months_data["Date"] = pd.to_datetime(all_months_data["Date"], errors="coerce")
-            task_trend = all_months_data.groupby([all_months_data["Date"].dt.to_period("M"), "Status"]).size().reset_index(name="Task Count")
+        # Periods come from the sheets' own Date column
+        if all_months_data["Source Date"].notna().any():
+            task_trend = all_months_data.groupby([all_months_data["Source Date"].dt.to_period("M").rename("Date"), "Status"]).size().reset_index(name="Task Count")
             task_trend["Date"] = task_trend["Date"].dt.strftime("%Y-%m")
             fig_task_trend = px.line(
                 task_trend,
@@ -115,7 +83,7 @@ if months_available:
 
         # Assignee Performance Across Months
         st.subheader("Assignee Performance Comparison Across Months")
-        if "Assignee" in all_months_data.columns:
+        if all_months_data["Assignee"].notna().any():
             assignee_performance = all_months_data.groupby(["Month", "Assignee"]).size().unstack(fill_value=0)
             fig_assignee_perf = px.bar(
                 assignee_performance,
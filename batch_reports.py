@@ -0,0 +1,187 @@
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from resource_charts import chart_names, resource_charts, uncompleted_tasks_by_month
+from task_data import current_directory, load_all_tasks, task_columns, write_atomic
+
+# Headless generator for the Resource-wise Analytics reports.
+# Renders one report per resource and month from the same chart definitions
+# as app.py, e.g.
+#
+#     python batch_reports.py --output reports --format html png --workers 8
+#
+# Bump report_version when the chart definitions change so every report is
+# rendered again on the next run.
+report_version = 1
+manifest_file_name = 'manifest.json'
+
+# Parsed task table of the current worker process and the row positions of
+# every (Resource Name, Month) report in it, set once by _init_worker
+_worker_df = None
+_worker_groups = None
+
+
+# Inputs of one report: its task rows plus what shapes the output files
+def report_fingerprint(report_df, formats):
+    row_hashes = pd.util.hash_pandas_object(report_df[task_columns], index=False).to_numpy()
+    digest = hashlib.sha256(row_hashes.tobytes())
+    digest.update(repr((report_version, sorted(formats))).encode())
+    return digest.hexdigest()
+
+
+def safe_file_name(name):
+    return re.sub(r'[^\w\- ]', '_', str(name)).strip() or '_'
+
+
+def report_paths(output_dir, resource, month, formats):
+    resource_dir = os.path.join(output_dir, safe_file_name(resource))
+    paths = {}
+    if 'html' in formats:
+        paths['html'] = os.path.join(resource_dir, f'{safe_file_name(month)}.html')
+    if 'png' in formats:
+        paths['png'] = os.path.join(resource_dir, safe_file_name(month))
+    return paths
+
+
+def load_manifest(output_dir):
+    path = os.path.join(output_dir, manifest_file_name)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir, manifest):
+    path = os.path.join(output_dir, manifest_file_name)
+    write_atomic(path, lambda f: f.write(json.dumps(manifest, indent=2, sort_keys=True).encode()))
+
+
+def _init_worker(df):
+    global _worker_df, _worker_groups
+    _worker_df = df
+    _worker_groups = df.groupby(['Resource Name', 'Month']).indices
+
+
+def render_html(path, resource, month, charts, incomplete_tasks):
+    parts = [
+        '<html><head><meta charset="utf-8">',
+        f'<title>{html.escape(f"{resource} - {month}")}</title></head><body>',
+        f'<h1>{html.escape(str(resource))} - {html.escape(str(month))}</h1>',
+    ]
+    for i, fig in enumerate(charts.values()):
+        parts.append(fig.to_html(full_html=False, include_plotlyjs='cdn' if i == 0 else False))
+    parts.append('<h3>Uncompleted Tasks by Month</h3>')
+    parts.append(incomplete_tasks.to_html(index=False))
+    parts.append('</body></html>')
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(parts))
+
+
+# Render the report of one resource and month in a worker process
+def render_report(resource, month, paths):
+    report_df = _worker_df.iloc[_worker_groups[(resource, month)]]
+    charts = resource_charts(report_df, resource)
+
+    for path in paths.values():
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    if 'html' in paths:
+        render_html(paths['html'], resource, month, charts, uncompleted_tasks_by_month(report_df))
+    if 'png' in paths:
+        for name, fig in charts.items():
+            fig.write_image(f"{paths['png']}_{name}.png")
+
+
+def output_exists(paths):
+    if 'html' in paths and not os.path.exists(paths['html']):
+        return False
+    if 'png' in paths:
+        return all(os.path.exists(f"{paths['png']}_{name}.png") for name in chart_names)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render Resource-wise Analytics reports for every resource and month.")
+    parser.add_argument('--data-dir', default=current_directory, help="Directory holding the <Month>.xlsx workbooks")
+    parser.add_argument('--output', default='reports', help="Directory the reports are written to")
+    parser.add_argument('--format', nargs='+', choices=['html', 'png'], default=['html'], dest='formats')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument('--months', nargs='+', help="Only render these months")
+    parser.add_argument('--resources', nargs='+', help="Only render these resources")
+    parser.add_argument('--force', action='store_true', help="Render reports even if their inputs did not change")
+    args = parser.parse_args(argv)
+
+    if 'png' in args.formats:
+        try:
+            import kaleido  # noqa: F401  (static image export backend of plotly)
+        except ImportError:
+            parser.error("PNG reports need the 'kaleido' package (pip install kaleido).")
+
+    start = time.perf_counter()
+    # Parse the workbooks once; the table is handed to every worker process
+    df = load_all_tasks(args.months, args.data_dir)
+    if df.empty:
+        print("No task data found.")
+        return 1
+    df = df[task_columns].dropna(subset=['Resource Name'])
+    if args.resources:
+        df = df[df['Resource Name'].isin(args.resources)]
+    if df.empty:
+        print("No reports match the selected resources.")
+        return 1
+
+    os.makedirs(args.output, exist_ok=True)
+    manifest = load_manifest(args.output)
+
+    jobs = {}
+    skipped = 0
+    for (resource, month), report_df in df.groupby(['Resource Name', 'Month'], sort=True):
+        key = f'{resource}/{month}'
+        fingerprint = report_fingerprint(report_df, args.formats)
+        paths = report_paths(args.output, resource, month, args.formats)
+        if not args.force and manifest.get(key) == fingerprint and output_exists(paths):
+            skipped += 1
+            continue
+        jobs[key] = (resource, month, paths, fingerprint)
+
+    print(f"Parsed {len(df)} tasks in {time.perf_counter() - start:.1f}s; "
+          f"{len(jobs)} reports to render, {skipped} unchanged.")
+
+    failed = 0
+    if jobs:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker, initargs=(df,)) as executor:
+            futures = {
+                executor.submit(render_report, resource, month, paths): key
+                for key, (resource, month, paths, _) in jobs.items()
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    failed += 1
+                    manifest.pop(key, None)
+                    print(f"Failed to render {key}: {e}")
+                else:
+                    manifest[key] = jobs[key][3]
+
+        save_manifest(args.output, manifest)
+
+    print(f"Rendered {len(jobs) - failed} reports in {time.perf_counter() - start:.1f}s "
+          f"({skipped} skipped, {failed} failed) into {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+from task_data import month_order
+
+# Cross-month carry-over of unfinished tasks.
+#
+# A task is identified by its normalized title, Resource Name and Tasks Type,
+# hashed into a 64-bit key. The task states of consecutive months are then
+# hash-joined on that key to follow every task that was not Done at the end
+# of a month into the next one.
+outcome_still_pending = 'Still Pending'
+outcome_completed_late = 'Completed Late'
+outcome_vanished = 'Vanished'
+outcomes = [outcome_still_pending, outcome_completed_late, outcome_vanished]
+
+carry_over_columns = ['From Month', 'To Month', 'Resource Name', 'Tasks Type', 'Task', 'Outcome']
+
+
+# 64-bit identity of every task row
+def task_keys(df):
+    identity = pd.DataFrame({
+        'Task': df['Tasks List'].astype(str).str.lower().str.replace(r'\s+', ' ', regex=True).str.strip(),
+        'Resource Name': df['Resource Name'].fillna('').astype(str),
+        'Tasks Type': df['Tasks Type'].astype(str),
+    })
+    return pd.util.hash_pandas_object(identity, index=False).to_numpy()
+
+
+# One row per task and month; a task counts as Done in a month if any of its
+# rows in that month is Done. Rows without a title cannot be followed across
+# months and are left out.
+def month_states(df):
+    titles = df['Tasks List']
+    df = df[titles.notna() & titles.astype(str).str.strip().ne('')]
+    tasks = pd.DataFrame({
+        'Month': df['Month'].to_numpy(),
+        'Key': task_keys(df),
+        'Resource Name': df['Resource Name'].to_numpy(),
+        'Tasks Type': df['Tasks Type'].to_numpy(),
+        'Task': df['Tasks List'].to_numpy(),
+        'Done': (df['Status'] == 'Done').to_numpy(),
+    })
+    return tasks.groupby(['Month', 'Key'], sort=False).agg(
+        **{
+            'Resource Name': ('Resource Name', 'first'),
+            'Tasks Type': ('Tasks Type', 'first'),
+            'Task': ('Task', 'first'),
+            'Done': ('Done', 'max'),
+        }
+    ).reset_index()
+
+
+# Outcome in the following month of every task left pending at the end of a
+# month: still pending, completed late, or vanished from the next month
+def carry_over(df):
+    if df.empty:
+        return pd.DataFrame(columns=carry_over_columns)
+
+    states = month_states(df)
+    by_month = dict(tuple(states.groupby('Month', sort=False)))
+    months = sorted(by_month, key=month_order)
+
+    transitions = []
+    for from_month, to_month in zip(months, months[1:]):
+        pending = by_month[from_month][~by_month[from_month]['Done']]
+        following = by_month[to_month][['Key', 'Done']].rename(columns={'Done': 'Done Next'})
+        joined = pending.merge(following, on='Key', how='left')
+
+        done_next = joined['Done Next']
+        joined['Outcome'] = np.select(
+            [done_next.isna().to_numpy(), done_next.eq(True).to_numpy()],
+            [outcome_vanished, outcome_completed_late],
+            default=outcome_still_pending
+        )
+        joined['From Month'] = from_month
+        joined['To Month'] = to_month
+        transitions.append(joined[carry_over_columns])
+
+    if not transitions:
+        return pd.DataFrame(columns=carry_over_columns)
+    return pd.concat(transitions, ignore_index=True)
+
+
+# Number of carried-over tasks per month transition and outcome
+def carry_over_summary(carried):
+    summary = carried.groupby(['From Month', 'To Month', 'Outcome']).size().unstack(fill_value=0)
+    summary = summary.reindex(columns=outcomes, fill_value=0).reset_index()
+    summary.columns.name = None
+    summary['Transition'] = summary['From Month'] + ' -> ' + summary['To Month']
+    summary['Month Order'] = summary['From Month'].map(month_order)
+    return summary.sort_values('Month Order').drop(columns='Month Order').reset_index(drop=True)
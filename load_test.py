@@ -0,0 +1,325 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from task_data import list_months
+
+# Concurrent-session load test for the dashboard.
+#
+# Starts app.py as one headless `streamlit run` server on localhost and
+# connects many simulated users to it over the same websocket protocol the
+# browser uses. The sessions therefore share the server process like real
+# users do: its GIL, its script threads and every process-wide cache. The
+# sessions of a mode connect, wait until all of them are open and then
+# rerun at the same time; each switches to the mode and steps through that
+# mode's widgets, e.g.
+#
+#     python load_test.py --sessions 50 --reruns 5
+#
+# Run it before and after a caching or parallelism change and compare the
+# rerun latency percentiles, throughput and the server's memory in each mode.
+#
+# What the numbers show: latency is from sending a rerun until the server
+# reports the script run finished, so it includes queueing behind the other
+# sessions but not browser rendering or a real network. Memory is the
+# resident size of the single server process, sampled while the mode runs,
+# and grows across modes as the shared caches fill. The server is started
+# once, so only the first mode sees cold caches. A multi-process deployment
+# (e.g. several servers sharing TASK_DATA_MODE=shared) is not modelled;
+# point --url at such a server to measure its latency without the memory.
+app_modes = ["Month-wise Summary", "Resource-wise Analytics", "Velocity", "Search Tasks", "Carry-over",
+             "Compare All Months"]
+search_queries = ['design', 'test', 'data', 'report', 'ui', 'api']
+
+# Widget element types the sessions interact with, and the WidgetState field
+# holding their value
+widget_value_fields = {
+    'radio': 'string_value',
+    'selectbox': 'string_value',
+    'text_input': 'string_value',
+    'multiselect': 'string_array_value',
+    'number_input': 'double_value',
+}
+
+
+# Websocket client that reruns the app like a browser tab does
+class Session:
+    def __init__(self, url):
+        self.url = url
+        self.connection = None
+        self.widgets = {}  # label -> (element type, widget proto) of the last run
+        self.states = {}  # widget id -> WidgetState set by this session
+
+    async def open(self, timeout):
+        self.connection = await websockets.connect(self.url, subprotocols=['streamlit'], max_size=None,
+                                                   open_timeout=timeout)
+        return await self.run(timeout)
+
+    async def close(self):
+        if self.connection is not None:
+            await self.connection.close()
+
+    def find_widget(self, label):
+        widget = self.widgets.get(label)
+        return widget[1] if widget is not None else None
+
+    def set_value(self, label, value):
+        element_type, widget = self.widgets[label]
+        state = WidgetState(id=widget.id)
+        field = widget_value_fields[element_type]
+        if field == 'string_array_value':
+            state.string_array_value.data.extend(value)
+        else:
+            setattr(state, field, value)
+        self.states[widget.id] = state
+
+    # Rerun the script with the widget values of this session; returns the
+    # latency and whether the run raised an exception
+    async def run(self, timeout):
+        message = BackMsg()
+        message.rerun_script.query_string = ''
+        widget_ids = {widget.id for _, widget in self.widgets.values()}
+        message.rerun_script.widget_states.widgets.extend(
+            state for widget_id, state in self.states.items() if widget_id in widget_ids
+        )
+
+        start = time.perf_counter()
+        await self.connection.send(message.SerializeToString())
+        widgets, failed = await asyncio.wait_for(self._receive_run(), timeout)
+        latency = time.perf_counter() - start
+        self.widgets = widgets
+        return latency, failed
+
+    async def _receive_run(self):
+        widgets = {}
+        failed = False
+        while True:
+            message = ForwardMsg()
+            message.ParseFromString(await self.connection.recv())
+            message_type = message.WhichOneof('type')
+            if message_type == 'delta' and message.delta.WhichOneof('type') == 'new_element':
+                element = message.delta.new_element
+                element_type = element.WhichOneof('type')
+                if element_type == 'exception':
+                    failed = True
+                elif element_type in widget_value_fields:
+                    widget = getattr(element, element_type)
+                    widgets[widget.label] = (element_type, widget)
+            elif message_type == 'script_finished':
+                if message.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                return widgets, failed or message.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY
+
+
+# Widget change for the n-th rerun of a session in a mode
+def interact(session, mode, step, months):
+    if mode == "Month-wise Summary":
+        session.set_value("Select Month:", months[step % len(months)])
+    elif mode in ("Resource-wise Analytics", "Velocity", "Carry-over"):
+        person = session.find_widget("Select a person:")
+        if person is not None:
+            session.set_value("Select a person:", person.options[step % len(person.options)])
+    elif mode == "Search Tasks":
+        session.set_value("Search task titles:", search_queries[step % len(search_queries)])
+    elif mode == "Compare All Months":
+        compare = session.find_widget("Select Months to Compare:")
+        if compare is not None and compare.options:
+            session.set_value("Select Months to Compare:", list(compare.options[:step % len(compare.options) + 1]))
+
+
+# Samples the resident memory of the server process in the background
+class RssSampler:
+    def __init__(self, pid, interval=0.1):
+        self.pid = pid
+        self.interval = interval
+        self.peak_kb = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def rss_kb(self):
+        try:
+            with open(f'/proc/{self.pid}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1])
+        except OSError:
+            pass
+        try:  # No procfs, e.g. macOS
+            return int(subprocess.run(['ps', '-o', 'rss=', '-p', str(self.pid)],
+                                      capture_output=True, text=True).stdout.strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak_kb = max(self.peak_kb, self.rss_kb())
+
+    def start(self):
+        self.peak_kb = self.rss_kb()
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def reset_peak(self):
+        self.peak_kb = self.rss_kb()
+
+
+# One simulated user in a mode. Every failed rerun, including a widget the
+# session could not find, counts as an error; a session that timed out or
+# lost its connection stops.
+async def run_session(session, mode, reruns, months, timeout):
+    latencies = []
+    errors = 0
+
+    async def timed_run():
+        nonlocal errors
+        latency, failed = await session.run(timeout)
+        latencies.append(latency)
+        errors += failed
+
+    try:
+        if mode != app_modes[0]:
+            session.set_value("Choose an option", mode)
+            await timed_run()
+
+        for step in range(reruns):
+            try:
+                interact(session, mode, step, months)
+            except Exception:
+                errors += 1
+                continue
+            await timed_run()
+    except (asyncio.TimeoutError, websockets.ConnectionClosed, OSError):
+        errors += 1
+    return latencies, errors
+
+
+async def run_mode(url, mode, sessions, reruns, months, timeout):
+    clients = [Session(url) for _ in range(sessions)]
+    opened = await asyncio.gather(*(client.open(timeout) for client in clients), return_exceptions=True)
+    errors = sum(1 for result in opened if isinstance(result, BaseException))
+    ready = [client for client, result in zip(clients, opened) if not isinstance(result, BaseException)]
+
+    # All sessions are open, now they rerun at the same time
+    started = time.perf_counter()
+    results = await asyncio.gather(*(run_session(client, mode, reruns, months, timeout) for client in ready))
+    elapsed = time.perf_counter() - started
+    await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+
+    latencies = np.array([latency for result in results for latency in result[0]])
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(latencies) else (np.nan, np.nan, np.nan)
+    return {
+        'mode': mode,
+        'sessions': sessions,
+        'reruns': len(latencies),
+        'errors': errors + sum(result[1] for result in results),
+        'p50_ms': round(p50 * 1000, 1),
+        'p95_ms': round(p95 * 1000, 1),
+        'p99_ms': round(p99 * 1000, 1),
+        'throughput_per_s': round(len(latencies) / elapsed, 2) if elapsed > 0 else float('nan'),
+    }
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
+
+# Start app.py as a headless server and wait until it is healthy
+def start_server(app_path, port, timeout):
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', app_path, '--server.headless', 'true',
+         '--server.port', str(port), '--server.fileWatcherType', 'none', '--browser.gatherUsageStats', 'false'],
+        cwd=os.path.dirname(app_path), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"streamlit exited with code {server.returncode}")
+        try:
+            with urllib.request.urlopen(f'http://localhost:{port}/_stcore/health', timeout=1) as response:
+                if response.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError(f"streamlit did not become healthy within {timeout}s")
+
+
+def print_report(report):
+    columns = ['mode', 'sessions', 'reruns', 'errors', 'p50_ms', 'p95_ms', 'p99_ms', 'throughput_per_s',
+               'server_peak_rss_mb', 'server_rss_mb']
+    widths = [max(len(column), *(len(str(row[column])) for row in report)) for column in columns]
+    print('  '.join(column.ljust(width) for column, width in zip(columns, widths)))
+    for row in report:
+        print('  '.join(str(row[column]).ljust(width) for column, width in zip(columns, widths)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure rerun latency of app.py under concurrent sessions.")
+    parser.add_argument('--app', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py'))
+    parser.add_argument('--url', help="Load an already running server (ws://host:port) instead of starting one")
+    parser.add_argument('--sessions', type=int, default=50, help="Number of concurrent simulated sessions")
+    parser.add_argument('--reruns', type=int, default=5, help="Widget interactions per session and mode")
+    parser.add_argument('--modes', nargs='+', choices=app_modes, default=app_modes)
+    parser.add_argument('--timeout', type=float, default=300, help="Seconds a single rerun may take")
+    parser.add_argument('--json', help="Also write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    app_path = os.path.abspath(args.app)
+    months = list_months(os.path.dirname(app_path))
+    if not months:
+        parser.error("No <Month>.xlsx workbooks found next to the app.")
+
+    server = sampler = None
+    if args.url:
+        url = f"{args.url.rstrip('/')}/_stcore/stream"
+    else:
+        port = free_port()
+        server = start_server(app_path, port, args.timeout)
+        sampler = RssSampler(server.pid)
+        sampler.start()
+        url = f'ws://localhost:{port}/_stcore/stream'
+
+    report = []
+    try:
+        for mode in args.modes:
+            print(f"Running {args.sessions} sessions x {args.reruns} reruns of '{mode}'...", flush=True)
+            if sampler is not None:
+                sampler.reset_peak()
+            row = asyncio.run(run_mode(url, mode, args.sessions, args.reruns, months, args.timeout))
+            row['server_peak_rss_mb'] = round(sampler.peak_kb / 1024, 1) if sampler else float('nan')
+            row['server_rss_mb'] = round(sampler.rss_kb() / 1024, 1) if sampler else float('nan')
+            report.append(row)
+    finally:
+        if sampler is not None:
+            sampler.stop()
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 1 if any(row['errors'] for row in report) else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
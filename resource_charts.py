@@ -0,0 +1,81 @@
+import pandas as pd
+import plotly.express as px
+
+
+# Names of the charts returned by resource_charts, in display order
+chart_names = ['status_by_month', 'task_type', 'tasks_over_time', 'heatmap', 'timeline']
+
+
+# Chart definitions of the Resource-wise Analytics view.
+# Shared by app.py and the headless batch report generator (batch_reports.py).
+def resource_charts(filtered_df, selected_person):
+    filtered_df = filtered_df.copy()
+    charts = {}
+
+    # Task Status Distribution by Month
+    charts['status_by_month'] = px.bar(
+        filtered_df.groupby(['Month', 'Status']).size().unstack(fill_value=0),
+        barmode='stack',
+        title=f"Task Status Distribution by Month for {selected_person}"
+    )
+
+    # Task Type distribution by Month
+    charts['task_type'] = px.histogram(
+        filtered_df,
+        x='Month',
+        color='Tasks Type',
+        title=f'Task Type Distribution by Month for {selected_person}'
+    )
+
+    # Task Load Over Time
+    filtered_df['Date'] = pd.to_datetime(filtered_df['Date'])  # Ensure Date is datetime
+    tasks_over_time = filtered_df.groupby([
+        filtered_df['Date'].dt.strftime('%Y-%m-%d'),  # Convert to string format
+        'Month'
+    ]).size().reset_index(name='Task Count')
+    tasks_over_time['Date'] = pd.to_datetime(tasks_over_time['Date'])  # Convert back to datetime
+
+    charts['tasks_over_time'] = px.line(
+        tasks_over_time,
+        x='Date',
+        y='Task Count',
+        color='Month',
+        title=f'Task Load Over Time for {selected_person}'
+    )
+
+    # Monthly Task Completion Heatmap
+    completion_counts = filtered_df[filtered_df['Status'] == 'Done'].groupby([
+        'Month',
+        filtered_df['Date'].dt.strftime('%Y-%m-%d')  # Convert to string format
+    ]).size().reset_index(name='Completions')
+    completion_counts['Date'] = pd.to_datetime(completion_counts['Date'])
+    completion_counts['Day'] = completion_counts['Date'].dt.day
+
+    charts['heatmap'] = px.density_heatmap(
+        completion_counts,
+        x='Month',
+        y='Day',
+        z='Completions',
+        title=f"Task Completion Heatmap for {selected_person}"
+    )
+
+    # Task Timeline
+    charts['timeline'] = px.scatter(
+        filtered_df,
+        x='Date',
+        y='Month',
+        color='Status',
+        hover_data=['Tasks List', 'Status'],
+        title=f'Task Timeline for {selected_person}'
+    )
+
+    return charts
+
+
+# Uncompleted Tasks by Month
+def uncompleted_tasks_by_month(filtered_df):
+    uncompleted_tasks = filtered_df[filtered_df['Status'] != 'Done']
+    grouped_incomplete_tasks = uncompleted_tasks.groupby(['Month', 'Resource Name'])['Tasks List'].apply(lambda x: ', '.join(x)).reset_index()
+    grouped_incomplete_tasks['Unique Incomplete Tasks'] = grouped_incomplete_tasks['Tasks List'].apply(lambda x: set(task.strip() for task in x.split(',')))
+    grouped_incomplete_tasks.drop(columns=['Tasks List'], inplace=True)
+    return grouped_incomplete_tasks
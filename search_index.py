@@ -0,0 +1,129 @@
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from task_data import current_directory, refresh_month_store
+
+# Inverted index over the task titles (Tasks List) of every month, stored
+# next to the monthly workbooks. Each month has its own vocabulary and
+# postings, keyed by the size/mtime of its workbook, so adding or editing a
+# month only re-indexes that month. The postings hold row positions within
+# the month; the matching rows are read from the task table of the app
+# (shared_dataset.load_tasks), so the index holds no copy of the tasks.
+# Build it ahead of time with
+#
+#     python search_index.py
+index_file_name = 'search_index.pkl'
+index_version = 2
+
+document_columns = ['Month', 'Resource Name', 'Status', 'Tasks Type', 'Date', 'Tasks List']
+token_pattern = r'\w+'
+
+
+def index_path(directory=current_directory):
+    return os.path.join(directory, index_file_name)
+
+
+def tokenize(text):
+    return re.findall(token_pattern, text.lower()) if text else []
+
+
+# Sorted vocabulary and the row positions of every token of one month
+def index_month(df):
+    titles = df['Tasks List'] if 'Tasks List' in df.columns else pd.Series(dtype=object)
+    titles = titles.reset_index(drop=True)
+
+    tokens = titles.astype(str).where(titles.notna(), '')
+    tokens = tokens.str.lower().str.findall(token_pattern).explode().dropna()
+    postings = pd.DataFrame({'token': tokens.to_numpy(), 'row': tokens.index.to_numpy(dtype=np.int64)})
+    postings = postings.drop_duplicates().sort_values(['token', 'row'])
+
+    vocabulary = postings['token'].drop_duplicates().to_numpy(dtype=str)
+    starts = np.flatnonzero(postings['token'].ne(postings['token'].shift()).to_numpy())
+    rows = postings['row'].to_numpy(dtype=np.int64)
+    return {
+        'size': len(titles),
+        'vocabulary': vocabulary,
+        'offsets': np.append(starts, len(rows)),
+        'rows': rows,
+    }
+
+
+# Bring the index up to date with the workbooks on disk; only added or
+# changed months are re-indexed
+def refresh_index(directory=current_directory):
+    return refresh_month_store(index_path(directory), index_version, index_month, lambda months: {}, directory)
+
+
+# Row positions containing a token; the last query token also matches as a
+# prefix so results update while the user is still typing
+def _lookup(entry, token, prefix):
+    vocabulary = entry['vocabulary']
+    start = np.searchsorted(vocabulary, token, side='left')
+    if prefix:
+        end = np.searchsorted(vocabulary, token + '\U0010ffff', side='left')
+    else:
+        end = start + 1 if start < len(vocabulary) and vocabulary[start] == token else start
+    if start >= end:
+        return np.empty(0, dtype=np.int64)
+    rows = entry['rows'][entry['offsets'][start]:entry['offsets'][end]]
+    return rows if end - start == 1 else np.unique(rows)
+
+
+# Distinct values of a task column, for the filters
+def filter_options(tasks, column):
+    if tasks.empty:
+        return []
+    return sorted(tasks[column].dropna().unique(), key=str)
+
+
+# Tasks whose title contains every query token, filtered by Resource Name,
+# Status and Month. tasks is the task table the index was built from; the
+# rows of each month appear in it in the order they were indexed.
+def search(index, tasks, query, resources=None, statuses=None, months=None):
+    tokens = tokenize(query)
+    if not tokens or tasks.empty:
+        return pd.DataFrame(columns=document_columns)
+
+    month_rows = tasks.groupby('Month', sort=False).indices
+    results = []
+    for month, entry in index['months'].items():
+        if months and month not in months:
+            continue
+        positions = month_rows.get(month)
+        if positions is None or len(positions) != entry['size']:
+            continue  # The table is at another version of this month's workbook
+
+        rows = None
+        for i, token in enumerate(tokens):
+            matched = _lookup(entry, token, prefix=i == len(tokens) - 1)
+            rows = matched if rows is None else np.intersect1d(rows, matched, assume_unique=True)
+            if len(rows) == 0:
+                break
+        if len(rows) == 0:
+            continue
+
+        docs = tasks.iloc[positions[rows]][document_columns]
+        if resources:
+            docs = docs[docs['Resource Name'].isin(resources)]
+        if statuses:
+            docs = docs[docs['Status'].isin(statuses)]
+        results.append(docs)
+
+    if not results:
+        return pd.DataFrame(columns=document_columns)
+    return pd.concat(results, ignore_index=True)
+
+
+# One page of search results, pages are numbered from 1
+def result_page(matches, page, page_size):
+    start = (page - 1) * page_size
+    return matches.iloc[start:start + page_size]
+
+
+if __name__ == '__main__':
+    built = refresh_index()
+    print(f"Indexed {sum(entry['size'] for entry in built['months'].values())} tasks "
+          f"from {len(built['months'])} months into {index_path()}")
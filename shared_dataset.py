@@ -0,0 +1,210 @@
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from task_data import (
+    current_directory, file_lock, list_months, load_all_tasks, month_file_path, source_columns, task_columns, write_atomic
+)
+
+# Shared, memory-mapped copy of the consolidated task table.
+#
+# One process parses the workbooks and publishes the typed table as an
+# uncompressed Arrow IPC file; every Streamlit server process memory-maps
+# that file, so the column buffers live once in the OS page cache instead of
+# once per process. Each publish writes a new versioned file and then swaps
+# the CURRENT pointer, so processes still reading an older version keep a
+# valid mapping until they attach to the new one.
+#
+# The table also carries the source columns of the month comparison views
+# and the rows without a parseable Date. Those rows are stored last, so the
+# analytics table is a zero-copy slice of the mapped one.
+#
+# Enable it with TASK_DATA_MODE=shared, or publish ahead of time with
+#
+#     python shared_dataset.py
+shared_dir_name = 'shared_data'
+pointer_file_name = 'CURRENT'
+lock_file_name = '.lock'
+versions_to_keep = 2
+
+# Layout of the published file; part of the version so a changed layout is
+# published again even if the workbooks did not change
+dataset_format = 2
+
+task_schema = pa.schema([
+    ('Month', pa.large_string()),
+    ('Resource Name', pa.large_string()),
+    ('Date', pa.timestamp('us')),
+    ('Tasks List', pa.large_string()),
+    ('Status', pa.large_string()),
+    ('Tasks Type', pa.large_string()),
+    ('Assignee', pa.large_string()),
+    ('Issue Type', pa.large_string()),
+    ('Source Date', pa.timestamp('us')),
+])
+table_columns = task_columns + source_columns
+date_columns = ['Date', 'Source Date']
+
+# Strings stay in the mapped Arrow buffers as pandas' Arrow-backed str dtype
+string_dtype = pd.StringDtype('pyarrow', na_value=np.nan)
+
+# Table attached by this process: version, memory-mapped file, all rows and
+# the dated rows
+_attached = {'version': None, 'source': None, 'df': None, 'dated': None}
+_lock = threading.Lock()
+
+
+def shared_mode_enabled():
+    return os.environ.get('TASK_DATA_MODE', '').lower() == 'shared'
+
+
+def shared_dir(directory=current_directory):
+    return os.environ.get('TASK_DATA_SHARED_DIR') or os.path.join(directory, shared_dir_name)
+
+
+# Size and modification time of every workbook; the dataset version is
+# derived from it, so any added, removed or edited month gives a new version
+def source_signature(directory=current_directory):
+    signature = {}
+    for month in sorted(list_months(directory)):
+        stat = os.stat(month_file_path(month, directory))
+        signature[month] = [stat.st_size, stat.st_mtime_ns]
+    return signature
+
+
+def signature_version(signature):
+    return hashlib.sha256(json.dumps([dataset_format, signature], sort_keys=True).encode()).hexdigest()[:16]
+
+
+# Whether a pointer refers to the current workbooks in the current layout
+def is_current(pointer, signature):
+    return pointer is not None and pointer.get('version') == signature_version(signature)
+
+
+def read_pointer(directory=current_directory):
+    try:
+        with open(os.path.join(shared_dir(directory), pointer_file_name)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# Bring the task table to the fixed Arrow schema, dated rows first
+def to_arrow_table(df):
+    if df.empty:
+        return task_schema.empty_table()
+    df = df.reindex(columns=table_columns)
+    for column in table_columns:
+        if column in date_columns:
+            df[column] = pd.to_datetime(df[column], errors='coerce')
+        else:
+            df[column] = df[column].where(df[column].isna(), df[column].astype(str))
+    df = df.sort_values('Date', key=lambda dates: dates.isna(), kind='stable')
+    return pa.Table.from_pandas(df, schema=task_schema, preserve_index=False)
+
+
+# Keep the newest versions so processes attached to them are not disturbed
+def _remove_old_versions(path, current_file):
+    versions = sorted(
+        (f for f in os.listdir(path) if f.startswith('tasks-') and f.endswith('.arrow')),
+        key=lambda f: os.path.getmtime(os.path.join(path, f)),
+        reverse=True
+    )
+    keep = [current_file] + [f for f in versions if f != current_file][:versions_to_keep - 1]
+    for file_name in versions:
+        if file_name in keep:
+            continue
+        try:
+            os.remove(os.path.join(path, file_name))
+        except OSError:  # Still mapped by a process on a platform that forbids it
+            pass
+
+
+def _write_table(path, table):
+    def write(f):
+        with pa.ipc.new_file(f, table.schema) as writer:
+            writer.write_table(table)
+    write_atomic(path, write)
+
+
+# Parse the workbooks and publish them as a new version of the shared table.
+# Publishers of all processes are serialized by a lock file, and a publisher
+# that finds the pointer already current once it holds the lock returns it,
+# so every process ends up mapping the same file. A published version file
+# is never rewritten.
+def publish(directory=current_directory):
+    path = shared_dir(directory)
+    os.makedirs(path, exist_ok=True)
+
+    with file_lock(os.path.join(path, lock_file_name)):
+        signature = source_signature(directory)
+        pointer = read_pointer(directory)
+        if is_current(pointer, signature) and os.path.exists(os.path.join(path, pointer['file'])):
+            return pointer
+
+        version = signature_version(signature)
+        file_name = f'tasks-{version}.arrow'
+        file_path = os.path.join(path, file_name)
+        table = pa.ipc.open_file(pa.memory_map(file_path, 'r')).read_all() if os.path.exists(file_path) else None
+        if table is None:
+            table = to_arrow_table(load_all_tasks(directory=directory, keep_undated=True))
+            _write_table(file_path, table)
+
+        pointer = {
+            'version': version,
+            'file': file_name,
+            'signature': signature,
+            'rows': table.num_rows,
+            'dated_rows': table.num_rows - table.column('Date').null_count,
+        }
+        write_atomic(os.path.join(path, pointer_file_name), lambda f: f.write(json.dumps(pointer, indent=2).encode()))
+
+        _remove_old_versions(path, file_name)
+        return pointer
+
+
+# Memory-map a published version. The string columns reference the mapped
+# buffers directly, so no per-process copy of the task text is made.
+def _map_version(directory, pointer):
+    source = pa.memory_map(os.path.join(shared_dir(directory), pointer['file']), 'r')
+    table = pa.ipc.open_file(source).read_all()
+    return source, table.to_pandas(types_mapper={pa.large_string(): string_dtype}.get)
+
+
+# Consolidated task table of the current published version. Publishes a new
+# version first when the workbooks changed since the last publish.
+def attach(directory=current_directory, include_undated=False):
+    with _lock:
+        pointer = read_pointer(directory)
+        if not is_current(pointer, source_signature(directory)):
+            pointer = publish(directory)
+
+        if _attached['version'] != pointer['version']:
+            try:
+                source, df = _map_version(directory, pointer)
+            except (OSError, pa.ArrowInvalid):  # Removed by another publisher meanwhile
+                pointer = publish(directory)
+                source, df = _map_version(directory, pointer)
+            _attached.update(version=pointer['version'], source=source, df=df, dated=df.iloc[:pointer['dated_rows']])
+
+        return _attached['df'] if include_undated else _attached['dated']
+
+
+# Task table for the apps: the shared table in shared mode, otherwise the
+# workbooks parsed by this process. Rows without a parseable Date are only
+# included for the month comparison views.
+def load_tasks(directory=current_directory, include_undated=False):
+    if shared_mode_enabled():
+        return attach(directory, include_undated)
+    return load_all_tasks(directory=directory, keep_undated=include_undated)
+
+
+if __name__ == '__main__':
+    published = publish()
+    print(f"Published version {published['version']} ({published['rows']} tasks) "
+          f"to {os.path.join(shared_dir(), published['file'])}")
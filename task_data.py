@@ -0,0 +1,367 @@
+import calendar
+import contextlib
+import os
+import pickle
+import tempfile
+import threading
+import warnings
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the threads of one process are serialized
+    fcntl = None
+
+# Directory holding the monthly workbooks (<Month>.xlsx)
+current_directory = os.path.dirname(os.path.abspath(__file__))
+
+sheet_name_loop = 'Loop Tasks'
+sheet_name_sprint = 'Sprint Tasks'
+
+# Columns of the consolidated task table
+task_columns = ['Month', 'Resource Name', 'Date', 'Tasks List', 'Status', 'Tasks Type']
+
+# Workbook columns kept as they are for the month comparison views: the Jira
+# Assignee and Issue Type of Sprint rows and the sheet's own Date column
+# (Sprint sheets without one get their Date from Created)
+source_columns = ['Assignee', 'Issue Type', 'Source Date']
+
+# Map the different spellings of a person to one Resource Name
+replace_dict = {
+    'V': 'Thota',
+    'SaradhiMuneendra': 'Saradhi',
+    'SaradhiMuneendra Gundabattina': 'Saradhi',
+    'Saradhi Muneendra Gundabattina': 'Saradhi',
+    "Palaniyappan": "Palan",
+    "Achyut Deshpande": "Achyut",
+    "Ajay kumar": "Ajay Kumar",
+    "Ajay": "Ajay Kumar",
+    'Sai': 'Sai Sampath Chinthavatla',
+    'Amitabh': 'Amitabh Sharma',
+    "Sneha": "Sneha Guthe",
+    'MS Manoj Singh': 'Manoj Singh',
+    "Somesh": "Somesh Fengade",
+    "Gopal": 'Gopalswamy Ramalingam',
+    'Naveen Adusumilli': 'Naveen',
+    "Manoj Singh Rawat": "Manoj Singh",
+    "Manoj": "Manoj Singh",
+    "Varad": "Varad Bhalsing",
+    "Varad Balasaheb Bhalsing": "Varad Bhalsing",
+    "Mahesh Katti": "Mahesh"
+}
+
+
+# Parsed task sheets of each workbook, shared by all sessions of the process.
+# Entries are futures so a month that is being prefetched in the background
+# is waited for instead of being parsed a second time.
+_workbook_cache = {}
+_workbook_cache_lock = threading.Lock()
+_prefetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='month-prefetch')
+
+
+# Size and modification time identify the state of a workbook
+def file_signature(file_path):
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+# Parse the Loop and Sprint sheets of a workbook in one pass over the file
+def _parse_task_sheets(file_path):
+    with pd.ExcelFile(file_path, engine="openpyxl") as workbook:
+        return {
+            sheet_name: workbook.parse(sheet_name)
+            for sheet_name in (sheet_name_loop, sheet_name_sprint)
+            if sheet_name in workbook.sheet_names
+        }
+
+
+# Mark a queued parse as started; False when another thread already runs it
+# or it was cancelled
+def _claim(future):
+    with _workbook_cache_lock:
+        if future.running() or future.done():
+            return False
+        return future.set_running_or_notify_cancel()
+
+
+def _run_parse(future, file_path):
+    if not _claim(future):
+        return
+    try:
+        future.set_result(_parse_task_sheets(file_path))
+    except Exception as e:
+        with _workbook_cache_lock:
+            if _workbook_cache.get(file_path, (None, None))[1] is future:
+                del _workbook_cache[file_path]
+        future.set_exception(e)
+
+
+# Future holding the parsed task sheets of a workbook. Starts the parse in
+# the background when asked to, otherwise in the calling thread. A caller
+# in the foreground takes over a prefetch that is still queued instead of
+# waiting behind the other prefetches for it.
+def _task_sheets_future(file_path, background=False):
+    file_path = os.path.abspath(file_path)
+    try:
+        signature = file_signature(file_path)
+    except FileNotFoundError:
+        with _workbook_cache_lock:
+            _workbook_cache.pop(file_path, None)
+        raise
+
+    with _workbook_cache_lock:
+        cached_signature, future = _workbook_cache.get(file_path, (None, None))
+        if future is not None and cached_signature == signature:
+            new = False
+        else:
+            if future is not None:
+                future.cancel()  # Drop a queued parse of the old file
+            future = Future()
+            _workbook_cache[file_path] = (signature, future)
+            new = True
+
+    if background:
+        if new:
+            _prefetch_pool.submit(_run_parse, future, file_path)
+    else:
+        _run_parse(future, file_path)
+    return future
+
+
+# Forget the parsed sheets of workbooks that were removed
+def _evict_missing():
+    with _workbook_cache_lock:
+        for file_path in [path for path in _workbook_cache if not os.path.exists(path)]:
+            _workbook_cache[file_path][1].cancel()
+            del _workbook_cache[file_path]
+
+
+# Parse workbooks in the background so that later loads are cache hits
+def prefetch_files(file_paths):
+    _evict_missing()
+    for file_path in file_paths:
+        with contextlib.suppress(FileNotFoundError):
+            _task_sheets_future(file_path, background=True)
+
+
+# Parsed task sheets of a workbook. The future handed out can be cancelled
+# by another session that saw a newer version of the workbook before this
+# thread claimed it; the newer version is loaded then.
+def _task_sheets(file_path):
+    while True:
+        try:
+            return _task_sheets_future(file_path).result()
+        except CancelledError:
+            continue
+
+
+# Function to load data from an Excel file
+def load_data(file_path, sheet_name):
+    if isinstance(file_path, str) and sheet_name in (sheet_name_loop, sheet_name_sprint):
+        sheets = _task_sheets(file_path)
+        if sheet_name in sheets:
+            return sheets[sheet_name].copy()  # Callers modify the frame in place
+    else:
+        try:
+            return pd.read_excel(file_path, sheet_name=sheet_name, engine="openpyxl")
+        except ValueError:
+            pass
+    # Handle case where the sheet does not exist
+    message = f"Sheet '{sheet_name}' not found in {file_path}. Proceeding without it."
+    if get_script_run_ctx(suppress_warning=True) is not None:
+        st.warning(message)
+    else:  # Outside a Streamlit session, e.g. batch_reports.py
+        warnings.warn(message, stacklevel=2)
+    return pd.DataFrame()  # Return an empty DataFrame
+
+
+# List the months that have a workbook in the data directory
+def list_months(directory=current_directory):
+    files = [f for f in os.listdir(directory) if f.endswith(".xlsx")]
+    return [os.path.splitext(f)[0] for f in files]
+
+
+# Path of the workbook for a month
+def month_file_path(month, directory=current_directory):
+    return os.path.join(directory, f'{month}.xlsx')
+
+
+# Calendar position of a month name, unknown names sort last
+def month_order(month):
+    months = list(calendar.month_name)
+    return months.index(month) if month in months else len(months)
+
+
+# Prefetch the neighbouring months of a month first, then the other months
+# that have a workbook
+def prefetch_months(month, directory=current_directory):
+    months = list(calendar.month_name[1:])
+    neighbours = []
+    if month in months:
+        index = months.index(month)
+        neighbours = [months[i] for i in (index - 1, index + 1) if 0 <= i < len(months)]
+    others = [m for m in sorted(list_months(directory), key=month_order) if m != month and m not in neighbours]
+    prefetch_files([month_file_path(m, directory) for m in neighbours + others])
+
+
+# Load one month and bring Sprint and Loop rows to the common task layout
+# (Month, Resource Name, Date, Tasks List, Status, Tasks Type) plus the
+# source columns. Rows without a parseable Date are left out unless
+# keep_undated is set.
+def load_month_tasks(month, directory=current_directory, keep_undated=False):
+    file_path = month_file_path(month, directory)
+
+    df_sprint = load_data(file_path, sheet_name_sprint)
+    df_loop = load_data(file_path, sheet_name_loop)
+
+    frames = []
+    if not df_loop.empty:
+        df_loop['Month'] = month
+        df_loop.columns = df_loop.columns.str.strip()
+        df_loop['Source Date'] = df_loop['Date'] if 'Date' in df_loop.columns else pd.NaT
+        df_loop['Tasks Type'] = "Loop"
+        frames.append(df_loop)
+
+    if not df_sprint.empty:
+        df_sprint['Month'] = month
+        df_sprint.columns = df_sprint.columns.str.strip()
+        df_sprint['Resource Name'] = df_sprint['Assignee'].apply(lambda x: x.split()[0] if isinstance(x, str) else None)
+        df_sprint['Source Date'] = df_sprint['Date'] if 'Date' in df_sprint.columns else pd.NaT
+        df_sprint = df_sprint.rename(columns={'Created': 'Date', "Summary": "Tasks List"})
+        df_sprint['Tasks Type'] = "Sprint"
+        frames.append(df_sprint)
+
+    if not frames:
+        return pd.DataFrame()
+
+    df = pd.concat(frames, ignore_index=True)
+    df['Resource Name'] = df['Resource Name'].str.strip()
+    df['Resource Name'] = df['Resource Name'].replace(replace_dict)
+
+    for column in source_columns:
+        if column not in df.columns:
+            df[column] = None
+    if 'Date' not in df.columns:
+        df['Date'] = pd.NaT
+    df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+    df['Source Date'] = pd.to_datetime(df['Source Date'], errors='coerce')
+    if keep_undated:
+        return df
+    # Rows without a parseable Date are left out of the analytics
+    return df.dropna(subset=['Date'])
+
+
+# Load and combine the task rows of several months.
+# Loop rows come first, then Sprint rows, each in month order.
+def load_all_tasks(months=None, directory=current_directory, keep_undated=False):
+    if months is None:
+        months = list_months(directory)
+
+    frames = [load_month_tasks(month, directory, keep_undated) for month in months]
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+
+    df = pd.concat(frames, ignore_index=True)
+    return df.sort_values('Tasks Type', kind='stable').reset_index(drop=True)
+
+
+# Lock shared by the threads of this process and, through flock on the lock
+# file, by every other process using the same data directory
+_file_locks = {}
+_file_locks_guard = threading.Lock()
+
+
+@contextlib.contextmanager
+def file_lock(lock_path):
+    with _file_locks_guard:
+        thread_lock = _file_locks.setdefault(os.path.abspath(lock_path), threading.Lock())
+    with thread_lock:
+        if fcntl is None:
+            yield
+            return
+        with open(lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+# Write a file through a unique temporary file so readers never see a
+# partial file and concurrent writers never share a temporary path
+def write_atomic(path, write):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f'{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _read_store(path, version):
+    try:
+        with open(path, 'rb') as f:
+            store = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    return store if isinstance(store, dict) and store.get('version') == version else None
+
+
+# Per-month stores (velocity metrics, search index) loaded by this process,
+# with the signature of the file they were read from
+_stores = {}
+
+
+# Bring a per-month store kept next to the workbooks up to date.
+# The store holds one entry per month, built by build_month from that month's
+# tasks and keyed by the signature of its workbook, so only added or changed
+# months are parsed. build_derived rebuilds the store-wide data from the month
+# entries whenever they change. The store stays in memory between reruns and
+# is only read from disk again when another process rewrote it.
+def refresh_month_store(path, version, build_month, build_derived, directory=current_directory):
+    with file_lock(f'{path}.lock'):
+        try:
+            disk_signature = file_signature(path)
+        except FileNotFoundError:
+            disk_signature = None
+
+        cached_signature, store = _stores.get(path, (None, None))
+        if store is None or cached_signature != disk_signature:
+            store = _read_store(path, version) if disk_signature is not None else None
+
+        if store is None:
+            months, changed = {}, True
+        else:
+            months, changed = dict(store['months']), False
+
+        months_available = list_months(directory)
+        for month in list(months):
+            if month not in months_available:
+                del months[month]
+                changed = True
+
+        for month in months_available:
+            signature = file_signature(month_file_path(month, directory))
+            entry = months.get(month)
+            if entry is not None and entry['signature'] == signature:
+                continue
+            months[month] = dict(build_month(load_month_tasks(month, directory)), signature=signature)
+            changed = True
+
+        if changed:
+            # A new store object, so sessions still reading the old one are unaffected
+            months = dict(sorted(months.items(), key=lambda item: month_order(item[0])))
+            store = dict(build_derived(months), version=version, months=months)
+            write_atomic(path, lambda f: pickle.dump(store, f))
+            disk_signature = file_signature(path)
+
+        _stores[path] = (disk_signature, store)
+        return store
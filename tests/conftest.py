@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Write a <Month>.xlsx workbook with Loop Tasks rows given as
+# (Tasks List, Resource Name, Date, Status) tuples and Sprint Tasks rows
+# given as (Summary, Assignee, Created, Status) tuples
+def write_month(directory, month, loop_rows, sprint_rows=()):
+    df_loop = pd.DataFrame(loop_rows, columns=['Tasks List', 'Resource Name', 'Date', 'Status'])
+    df_loop['Date'] = pd.to_datetime(df_loop['Date'])
+    df_sprint = pd.DataFrame(list(sprint_rows), columns=['Summary', 'Assignee', 'Created', 'Status'])
+    df_sprint['Created'] = pd.to_datetime(df_sprint['Created'])
+    with pd.ExcelWriter(os.path.join(directory, f'{month}.xlsx'), engine='openpyxl') as writer:
+        df_loop.to_excel(writer, sheet_name='Loop Tasks', index=False)
+        df_sprint.to_excel(writer, sheet_name='Sprint Tasks', index=False)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    write_month(tmp_path, 'March', [
+        ('Design login page', 'Ritika', '2024-03-04', 'Done'),
+        ('Fix spark logs', 'Naveen', '2024-03-05', 'To do'),
+        ('Write tests', 'Naveen', '2024-03-12', 'Done'),
+    ])
+    write_month(tmp_path, 'April', [
+        ('Fix spark logs', 'Naveen', '2024-04-02', 'Done'),
+        ('Review designs', 'Ritika', '2024-04-09', 'In Progress'),
+    ])
+    return str(tmp_path)
@@ -0,0 +1,67 @@
+import json
+import os
+
+from conftest import write_month
+
+import batch_reports
+
+
+def render(data_dir, output_dir):
+    assert batch_reports.main(['--data-dir', data_dir, '--output', output_dir, '--workers', '2']) == 0
+
+
+def report_times(output_dir):
+    times = {}
+    for resource in sorted(os.listdir(output_dir)):
+        resource_dir = os.path.join(output_dir, resource)
+        if os.path.isdir(resource_dir):
+            for file_name in os.listdir(resource_dir):
+                times[f'{resource}/{file_name}'] = os.stat(os.path.join(resource_dir, file_name)).st_mtime_ns
+    return times
+
+
+def test_only_changed_reports_are_rendered(data_dir, tmp_path):
+    output_dir = str(tmp_path / 'reports')
+
+    render(data_dir, output_dir)
+    first = report_times(output_dir)
+    assert sorted(first) == ['Naveen/April.html', 'Naveen/March.html', 'Ritika/April.html', 'Ritika/March.html']
+    with open(os.path.join(output_dir, batch_reports.manifest_file_name)) as f:
+        assert sorted(json.load(f)) == ['Naveen/April', 'Naveen/March', 'Ritika/April', 'Ritika/March']
+
+    # Nothing changed: every report is skipped
+    render(data_dir, output_dir)
+    assert report_times(output_dir) == first
+
+    # April changed for Naveen only
+    write_month(data_dir, 'April', [
+        ('Fix spark logs', 'Naveen', '2024-04-02', 'To do'),
+        ('Review designs', 'Ritika', '2024-04-09', 'In Progress'),
+    ])
+    render(data_dir, output_dir)
+    rerendered = {name for name, mtime in report_times(output_dir).items() if mtime != first[name]}
+    assert rerendered == {'Naveen/April.html'}
+
+
+def test_missing_output_is_rendered_again(data_dir, tmp_path):
+    output_dir = str(tmp_path / 'reports')
+
+    render(data_dir, output_dir)
+    os.remove(os.path.join(output_dir, 'Ritika', 'March.html'))
+    first = report_times(output_dir)
+
+    render(data_dir, output_dir)
+    times = report_times(output_dir)
+    assert 'Ritika/March.html' in times
+    assert {name for name in first if times[name] != first[name]} == set()
+
+
+def test_output_exists_checks_every_chart(tmp_path):
+    paths = batch_reports.report_paths(str(tmp_path), 'Naveen', 'March', ['png'])
+    os.makedirs(os.path.dirname(paths['png']))
+    for name in batch_reports.chart_names[:-1]:
+        open(f"{paths['png']}_{name}.png", 'w').close()
+    assert not batch_reports.output_exists(paths)
+
+    open(f"{paths['png']}_{batch_reports.chart_names[-1]}.png", 'w').close()
+    assert batch_reports.output_exists(paths)
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+import carry_over
+
+
+# Task table rows given as (Month, Resource Name, Tasks List, Status)
+def tasks(rows):
+    df = pd.DataFrame(rows, columns=['Month', 'Resource Name', 'Tasks List', 'Status'])
+    df['Tasks Type'] = 'Loop'
+    return df
+
+
+def outcomes_by_task(carried):
+    return dict(zip(carried['Task'], carried['Outcome']))
+
+
+def test_classifies_pending_tasks():
+    carried = carry_over.carry_over(tasks([
+        ('March', 'Naveen', 'Fix spark logs', 'To do'),
+        ('March', 'Naveen', 'Write tests', 'In Progress'),
+        ('March', 'Ritika', 'Review designs', 'To do'),
+        ('March', 'Ritika', 'Design login page', 'Done'),
+        ('April', 'Naveen', 'fix  Spark logs ', 'Done'),
+        ('April', 'Naveen', 'Write tests', 'In Progress'),
+    ]))
+
+    assert outcomes_by_task(carried) == {
+        'Fix spark logs': carry_over.outcome_completed_late,
+        'Write tests': carry_over.outcome_still_pending,
+        'Review designs': carry_over.outcome_vanished,
+    }
+    assert set(carried['From Month']) == {'March'}
+    assert set(carried['To Month']) == {'April'}
+
+
+def test_task_done_in_any_row_counts_as_done():
+    carried = carry_over.carry_over(tasks([
+        ('March', 'Naveen', 'Fix spark logs', 'To do'),
+        ('March', 'Naveen', 'Fix spark logs', 'Done'),
+        ('April', 'Naveen', 'Other task', 'To do'),
+    ]))
+
+    assert 'Fix spark logs' not in set(carried['Task'])
+
+
+def test_untitled_tasks_are_not_matched():
+    carried = carry_over.carry_over(tasks([
+        ('March', 'Naveen', np.nan, 'To do'),
+        ('March', 'Naveen', '  ', 'To do'),
+        ('April', 'Naveen', np.nan, 'Done'),
+        ('April', 'Naveen', 'nan', 'To do'),
+    ]))
+
+    assert carried.empty
+
+
+def test_summary_counts_outcomes_per_transition():
+    carried = carry_over.carry_over(tasks([
+        ('April', 'Naveen', 'Write tests', 'To do'),
+        ('March', 'Naveen', 'Fix spark logs', 'To do'),
+        ('March', 'Naveen', 'Write tests', 'To do'),
+        ('April', 'Naveen', 'Fix spark logs', 'Done'),
+        ('May', 'Naveen', 'Write tests', 'Done'),
+    ]))
+    summary = carry_over.carry_over_summary(carried)
+
+    assert list(summary['Transition']) == ['March -> April', 'April -> May']
+    assert summary[carry_over.outcomes].to_numpy().tolist() == [[1, 1, 0], [0, 1, 0]]
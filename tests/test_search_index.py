@@ -0,0 +1,55 @@
+import pytest
+
+from conftest import write_month
+
+import search_index
+import shared_dataset
+
+
+@pytest.fixture(params=['', 'shared'])
+def tasks(request, data_dir, monkeypatch):
+    monkeypatch.setenv('TASK_DATA_MODE', request.param)
+    monkeypatch.delenv('TASK_DATA_SHARED_DIR', raising=False)
+    monkeypatch.setattr(shared_dataset, '_attached', {'version': None, 'source': None, 'df': None, 'dated': None})
+    return shared_dataset.load_tasks(data_dir)
+
+
+def test_search_matches_every_token(data_dir, tasks):
+    index = search_index.refresh_index(data_dir)
+
+    matches = search_index.search(index, tasks, 'fix spark')
+    assert list(matches['Month']) == ['March', 'April']
+    assert list(matches['Status']) == ['To do', 'Done']
+    assert search_index.search(index, tasks, 'spark design').empty
+
+
+def test_last_token_matches_as_prefix(data_dir, tasks):
+    index = search_index.refresh_index(data_dir)
+
+    assert list(search_index.search(index, tasks, 'des')['Tasks List']) == ['Design login page', 'Review designs']
+    assert search_index.search(index, tasks, 'des login').empty
+
+
+def test_search_filters(data_dir, tasks):
+    index = search_index.refresh_index(data_dir)
+
+    assert search_index.filter_options(tasks, 'Resource Name') == ['Naveen', 'Ritika']
+    matches = search_index.search(index, tasks, 'fix', statuses=['Done'], months=['April'])
+    assert list(matches['Month']) == ['April']
+    assert search_index.search(index, tasks, 'fix', resources=['Ritika']).empty
+
+
+def test_index_holds_no_task_rows(data_dir):
+    index = search_index.refresh_index(data_dir)
+
+    assert set(index['months']['March']) == {'size', 'vocabulary', 'offsets', 'rows', 'signature'}
+
+
+def test_refresh_picks_up_changed_month(data_dir):
+    search_index.refresh_index(data_dir)
+
+    write_month(data_dir, 'April', [('Deploy dashboard', 'Naveen', '2024-04-02', 'Done')])
+    refreshed = search_index.refresh_index(data_dir)
+    tasks = shared_dataset.load_tasks(data_dir)
+    assert list(search_index.search(refreshed, tasks, 'deploy')['Month']) == ['April']
+    assert search_index.search(refreshed, tasks, 'review').empty
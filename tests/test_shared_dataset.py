@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from conftest import write_month
+
+import shared_dataset
+
+
+@pytest.fixture(autouse=True)
+def detached(monkeypatch):
+    monkeypatch.delenv('TASK_DATA_SHARED_DIR', raising=False)
+    monkeypatch.setattr(shared_dataset, '_attached', {'version': None, 'source': None, 'df': None, 'dated': None})
+
+
+def version_files(data_dir):
+    return sorted(f for f in os.listdir(shared_dataset.shared_dir(data_dir)) if f.endswith('.arrow'))
+
+
+# Rewrite a workbook so its signature changes
+def edit_month(data_dir, status):
+    write_month(data_dir, 'April', [('Fix spark logs', 'Naveen', '2024-04-02', status)])
+
+
+def test_attach_maps_published_table(data_dir):
+    pointer = shared_dataset.publish(data_dir)
+    df = shared_dataset.attach(data_dir)
+
+    assert pointer['rows'] == 5
+    assert len(df) == 5
+    assert set(df['Resource Name']) == {'Naveen', 'Ritika'}
+    for column in ['Month', 'Resource Name', 'Tasks List', 'Status', 'Tasks Type']:
+        assert df[column].dtype == shared_dataset.string_dtype
+    assert shared_dataset.attach(data_dir) is df
+
+
+def test_undated_rows_follow_dated_rows(data_dir):
+    write_month(data_dir, 'May', [('Plan sprint', 'Ritika', None, 'To do')])
+
+    shared_dataset.publish(data_dir)
+    assert len(shared_dataset.attach(data_dir)) == 5
+    everything = shared_dataset.attach(data_dir, include_undated=True)
+    assert len(everything) == 6
+    assert everything['Tasks List'].iloc[-1] == 'Plan sprint'
+
+
+def test_changed_workbook_swaps_version(data_dir):
+    first = shared_dataset.publish(data_dir)
+    assert shared_dataset.attach(data_dir)['Status'].tolist().count('Done') == 3
+
+    edit_month(data_dir, 'To do')
+    df = shared_dataset.attach(data_dir)
+    pointer = shared_dataset.read_pointer(data_dir)
+
+    assert pointer['version'] != first['version']
+    assert pointer['file'] in version_files(data_dir)
+    assert df['Status'].tolist().count('Done') == 2
+
+
+def test_old_versions_are_removed(data_dir):
+    shared_dataset.publish(data_dir)
+    for status in ['To do', 'In Progress', 'Done']:
+        edit_month(data_dir, status)
+        current = shared_dataset.publish(data_dir)
+
+    files = version_files(data_dir)
+    assert len(files) == shared_dataset.versions_to_keep
+    assert current['file'] in files
+
+
+def test_unchanged_publish_keeps_file(data_dir, monkeypatch):
+    first = shared_dataset.publish(data_dir)
+    path = os.path.join(shared_dataset.shared_dir(data_dir), first['file'])
+    stat = os.stat(path)
+
+    def parse(*args, **kwargs):
+        raise AssertionError("workbooks parsed again")
+    monkeypatch.setattr(shared_dataset, 'load_all_tasks', parse)
+
+    assert shared_dataset.publish(data_dir) == first
+    assert (os.stat(path).st_ino, os.stat(path).st_mtime_ns) == (stat.st_ino, stat.st_mtime_ns)
+
+
+def test_load_tasks_without_shared_mode(data_dir, monkeypatch):
+    monkeypatch.delenv('TASK_DATA_MODE', raising=False)
+
+    df = shared_dataset.load_tasks(data_dir)
+    assert len(df) == 5
+    assert not os.path.exists(shared_dataset.shared_dir(data_dir))
@@ -0,0 +1,134 @@
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import write_month
+
+import task_data
+
+
+class QueuedPool:
+    # Executor whose tasks stay queued until run_all is called
+    def __init__(self):
+        self.queued = []
+
+    def submit(self, fn, *args):
+        self.queued.append((fn, args))
+
+    def run_all(self):
+        for fn, args in self.queued:
+            fn(*args)
+
+
+@pytest.fixture
+def queued_pool(monkeypatch):
+    pool = QueuedPool()
+    monkeypatch.setattr(task_data, '_prefetch_pool', pool)
+    monkeypatch.setattr(task_data, '_workbook_cache', {})
+    return pool
+
+
+def test_load_takes_over_queued_prefetch(data_dir, queued_pool, monkeypatch):
+    task_data.prefetch_months('March', data_dir)
+    assert len(queued_pool.queued) == 1
+
+    # Parsed in the foreground although the prefetch never started
+    assert len(task_data.load_month_tasks('April', data_dir)) == 2
+
+    parsed = []
+    parse_task_sheets = task_data._parse_task_sheets
+    monkeypatch.setattr(task_data, '_parse_task_sheets', lambda file_path: parsed.append(file_path) or parse_task_sheets(file_path))
+    queued_pool.run_all()  # The claimed parse is skipped by the prefetch
+    assert parsed == []
+
+
+def test_removed_workbook_is_evicted(data_dir, queued_pool):
+    task_data.prefetch_months('March', data_dir)
+    queued_pool.run_all()
+    april = os.path.join(data_dir, 'April.xlsx')
+    assert april in task_data._workbook_cache
+
+    os.remove(april)
+    task_data.prefetch_months('March', data_dir)
+    assert april not in task_data._workbook_cache
+    with pytest.raises(FileNotFoundError):
+        task_data.load_data(april, task_data.sheet_name_loop)
+
+
+def test_month_tasks_normalize_sprint_rows(tmp_path):
+    write_month(tmp_path, 'May', [('Fix spark logs', ' Naveen Adusumilli ', '2024-05-02', 'Done')], [
+        ('Build ingestion job', 'Ritika Sharma', '2024-05-03', 'In Progress'),
+        ('Tune cluster', 'Naveen Adusumilli', None, 'To do'),
+    ])
+
+    df = task_data.load_month_tasks('May', str(tmp_path))
+    assert list(df['Tasks Type']) == ['Loop', 'Sprint']
+    assert list(df['Resource Name']) == ['Naveen', 'Ritika']
+    assert list(df['Tasks List']) == ['Fix spark logs', 'Build ingestion job']
+    assert df['Date'].tolist() == [pd.Timestamp('2024-05-02'), pd.Timestamp('2024-05-03')]
+    # Source columns as they are in the sheets
+    assert df['Assignee'].isna().tolist() == [True, False]
+    assert df['Assignee'].iloc[1] == 'Ritika Sharma'
+    assert df['Source Date'].isna().tolist() == [False, True]
+
+    undated = task_data.load_month_tasks('May', str(tmp_path), keep_undated=True)
+    assert list(undated['Tasks List']) == ['Fix spark logs', 'Build ingestion job', 'Tune cluster']
+
+
+def test_load_retries_cancelled_parse(data_dir, queued_pool, monkeypatch):
+    march = os.path.join(data_dir, 'March.xlsx')
+    claim = task_data._claim
+    cancelled = []
+
+    # Another session sees a newer version of the workbook and replaces its
+    # cache entry before this thread claims the parse
+    def racing_claim(future):
+        if not cancelled:
+            os.utime(march, ns=(0, 0))
+            task_data.prefetch_files([march])
+            cancelled.append(future.cancelled())
+        return claim(future)
+    monkeypatch.setattr(task_data, '_claim', racing_claim)
+
+    assert len(task_data.load_data(march, task_data.sheet_name_loop)) == 3
+    assert cancelled == [True]
+
+
+def test_month_store_only_rebuilds_changed_months(data_dir, monkeypatch):
+    path = os.path.join(data_dir, 'store.pkl')
+
+    def refresh():
+        return task_data.refresh_month_store(path, 1, lambda df: {'rows': len(df)},
+                                             lambda months: {'total': sum(m['rows'] for m in months.values())}, data_dir)
+
+    first = refresh()
+    assert list(first['months']) == ['March', 'April']
+    assert first['total'] == 5
+
+    parsed = []
+    load_month_tasks = task_data.load_month_tasks
+    monkeypatch.setattr(task_data, 'load_month_tasks', lambda month, directory: parsed.append(month) or load_month_tasks(month, directory))
+
+    assert refresh() is first
+    assert parsed == []
+
+    write_month(data_dir, 'April', [('Fix spark logs', 'Naveen', '2024-04-02', 'Done')])
+    assert refresh()['total'] == 4
+    assert parsed == ['April']
+
+    os.remove(os.path.join(data_dir, 'April.xlsx'))
+    assert list(refresh()['months']) == ['March']
+    assert parsed == ['April']
+
+
+def test_month_store_reloads_store_written_by_another_process(data_dir, monkeypatch):
+    path = os.path.join(data_dir, 'store.pkl')
+    first = task_data.refresh_month_store(path, 1, lambda df: {'rows': len(df)}, lambda months: {}, data_dir)
+
+    # Another process rebuilt the store; this one reads it instead of parsing
+    monkeypatch.setattr(task_data, '_stores', {})
+    monkeypatch.setattr(task_data, 'load_month_tasks', None)
+    reloaded = task_data.refresh_month_store(path, 1, lambda df: {'rows': len(df)}, lambda months: {}, data_dir)
+    assert reloaded == first
+    assert reloaded is not first
@@ -0,0 +1,48 @@
+import os
+import threading
+
+from conftest import write_month
+
+import velocity
+
+
+def test_refresh_builds_series(data_dir):
+    metrics = velocity.refresh_metrics(data_dir)
+
+    monthly = metrics['monthly'].set_index(['Resource Name', 'Month'])
+    assert monthly.loc[('Naveen', 'March'), 'Total'] == 2
+    assert monthly.loc[('Naveen', 'March'), 'Done'] == 1
+    assert monthly.loc[('Naveen', 'March'), 'Not Done'] == 1
+    assert list(metrics['monthly']['Month'].drop_duplicates()) == ['March', 'April']
+    assert metrics['weekly']['Done'].sum() == 3
+    assert os.path.exists(velocity.metrics_path(data_dir))
+
+
+def test_refresh_picks_up_changed_month(data_dir):
+    velocity.refresh_metrics(data_dir)
+
+    write_month(data_dir, 'April', [('Fix spark logs', 'Naveen', '2024-04-02', 'Done')])
+    refreshed = velocity.refresh_metrics(data_dir)
+    monthly = refreshed['monthly'].set_index(['Resource Name', 'Month'])
+    assert monthly.loc[('Naveen', 'April'), 'Done'] == 1
+    assert ('Ritika', 'April') not in monthly.index
+    assert refreshed['monthly']['Total'].sum() == 4
+
+
+def test_concurrent_refresh(data_dir):
+    errors = []
+
+    def refresh():
+        try:
+            velocity.refresh_metrics(data_dir)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=refresh) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert not [f for f in os.listdir(data_dir) if f.endswith('.tmp')]
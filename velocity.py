@@ -0,0 +1,122 @@
+import os
+
+import pandas as pd
+
+from task_data import current_directory, month_order, refresh_month_store
+
+# Materialized velocity metrics, stored next to the monthly workbooks.
+# Each month keeps its own partial aggregates together with the size/mtime of
+# its workbook, so only added or changed months are re-parsed on refresh.
+metrics_file_name = 'velocity_metrics.pkl'
+metrics_version = 2
+
+group_columns = ['Resource Name', 'Tasks Type']
+rolling_weeks = 4
+
+
+def metrics_path(directory=current_directory):
+    return os.path.join(directory, metrics_file_name)
+
+
+# Weekly and monthly Total/Done counts of one month's tasks
+def month_partials(df):
+    if df.empty:
+        return pd.DataFrame(columns=group_columns + ['Week', 'Total', 'Done']), \
+            pd.DataFrame(columns=group_columns + ['Month', 'Total', 'Done'])
+
+    df = df.dropna(subset=['Resource Name'])
+    tasks = df[group_columns].copy()
+    tasks['Month'] = df['Month']
+    tasks['Week'] = df['Date'].dt.to_period('W').dt.start_time
+    tasks['Done'] = (df['Status'] == 'Done').astype(int)
+
+    weekly = tasks.groupby(group_columns + ['Week']).agg(
+        Total=('Done', 'size'),
+        Done=('Done', 'sum')
+    ).reset_index()
+    monthly = tasks.groupby(group_columns + ['Month']).agg(
+        Total=('Done', 'size'),
+        Done=('Done', 'sum')
+    ).reset_index()
+    return weekly, monthly
+
+
+# Weekly throughput per resource and task type, with gaps filled by zero
+# weeks so the rolling mean covers calendar weeks rather than active weeks
+def build_weekly_series(weekly_partials):
+    weekly_partials = weekly_partials.astype({'Total': int, 'Done': int})
+    weekly = weekly_partials.groupby(group_columns + ['Week'])[['Total', 'Done']].sum()
+    if weekly.empty:
+        return pd.DataFrame(columns=group_columns + ['Week', 'Total', 'Done', 'Rolling Done'])
+
+    weeks = pd.date_range(weekly.index.get_level_values('Week').min(),
+                          weekly.index.get_level_values('Week').max(), freq='7D')
+    done = weekly['Done'].unstack(group_columns).reindex(weeks, fill_value=0).fillna(0)
+    total = weekly['Total'].unstack(group_columns).reindex(weeks, fill_value=0).fillna(0)
+    rolling = done.rolling(rolling_weeks, min_periods=1).mean()
+
+    series = pd.DataFrame({
+        'Total': total.stack(group_columns, future_stack=True),
+        'Done': done.stack(group_columns, future_stack=True),
+        'Rolling Done': rolling.stack(group_columns, future_stack=True),
+    })
+    series.index = series.index.set_names(['Week'] + group_columns)
+    series = series.reset_index()[group_columns + ['Week', 'Total', 'Done', 'Rolling Done']]
+    series[['Total', 'Done']] = series[['Total', 'Done']].astype(int)
+    return series
+
+
+# Monthly throughput, done ratio and not-done count per resource and task type.
+# Not Done is per monthly snapshot; cross-month carry-over is in carry_over.py.
+def build_monthly_series(monthly_partials):
+    monthly_partials = monthly_partials.astype({'Total': int, 'Done': int})
+    monthly = monthly_partials.groupby(group_columns + ['Month'])[['Total', 'Done']].sum().reset_index()
+    monthly['Not Done'] = monthly['Total'] - monthly['Done']
+    monthly['Done Ratio'] = (monthly['Done'] / monthly['Total']).where(monthly['Total'] > 0, 0.0)
+    monthly['Month Order'] = monthly['Month'].map(month_order)
+    return monthly.sort_values(['Month Order'] + group_columns).drop(columns='Month Order').reset_index(drop=True)
+
+
+def _build_month(df):
+    weekly, monthly = month_partials(df)
+    return {'weekly': weekly, 'monthly': monthly}
+
+
+def _build_series(months):
+    empty_weekly, empty_monthly = month_partials(pd.DataFrame())
+    entries = months.values()
+    return {
+        'weekly': build_weekly_series(
+            pd.concat([empty_weekly] + [entry['weekly'] for entry in entries], ignore_index=True)
+        ),
+        'monthly': build_monthly_series(
+            pd.concat([empty_monthly] + [entry['monthly'] for entry in entries], ignore_index=True)
+        ),
+    }
+
+
+# Bring the stored metrics up to date with the workbooks on disk.
+# Only months whose workbook was added or changed are parsed; the derived
+# series are rebuilt from the (small) per-month partials.
+def refresh_metrics(directory=current_directory):
+    return refresh_month_store(metrics_path(directory), metrics_version, _build_month, _build_series, directory)
+
+
+# Sum the precomputed series over the selected resources and task types
+def select_series(store, resource='All', task_types=None):
+    weekly = store['weekly']
+    monthly = store['monthly']
+    if resource != 'All':
+        weekly = weekly[weekly['Resource Name'] == resource]
+        monthly = monthly[monthly['Resource Name'] == resource]
+    if task_types:
+        weekly = weekly[weekly['Tasks Type'].isin(task_types)]
+        monthly = monthly[monthly['Tasks Type'].isin(task_types)]
+
+    weekly = weekly.groupby('Week')[['Total', 'Done', 'Rolling Done']].sum().reset_index()
+
+    monthly = monthly.groupby(['Month', 'Tasks Type'])[['Total', 'Done', 'Not Done']].sum().reset_index()
+    monthly['Done Ratio'] = (monthly['Done'] / monthly['Total']).where(monthly['Total'] > 0, 0.0)
+    monthly['Month Order'] = monthly['Month'].map(month_order)
+    monthly = monthly.sort_values(['Month Order', 'Tasks Type']).drop(columns='Month Order').reset_index(drop=True)
+    return weekly, monthly